@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import functools
-from typing import List
+import itertools
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Tuple
 
 from dataclasses import dataclass
 
@@ -17,6 +19,9 @@ from ..enums import KeymastersKeepGamePlatforms
 class GunfireRebornArchipelagoOptions:
     gunfire_reborn_dlc_owned: GunfireRebornDLCOwned
     gunfire_reborn_include_spiritual_assault: GunfireRebornIncludeSpiritualAssault
+    gunfire_reborn_excluded_characters: GunfireRebornExcludedCharacters
+    gunfire_reborn_excluded_weapons: GunfireRebornExcludedWeapons
+    gunfire_reborn_excluded_maps: GunfireRebornExcludedMaps
 
 class GunfireRebornGame(Game):
     name = "Gunfire Reborn"
@@ -37,7 +42,7 @@ class GunfireRebornGame(Game):
     options_cls = GunfireRebornArchipelagoOptions
 
     def optional_game_constraint_templates(self) -> List[GameObjectiveTemplate]:
-        return [
+        templates: List[GameObjectiveTemplate] = [
             GameObjectiveTemplate(
                 label="Cannot use the following weapons (unless required): WEAPONS",
                 data={
@@ -72,6 +77,8 @@ class GunfireRebornGame(Game):
             ),
         ]
 
+        return [template for template in templates if self.is_feasible(template)]
+
     def game_objective_templates(self) -> List[GameObjectiveTemplate]:
         templates: List[GameObjectiveTemplate] = [
             GameObjectiveTemplate(
@@ -135,7 +142,7 @@ class GunfireRebornGame(Game):
             GameObjectiveTemplate(
                 label="Win a run on Reincarnation Difficulty with the following Bizarre Dreams enabled: BIZARRE_DREAM",
                 data={
-                    "BIZARRE_DREAM": (self.bizarre_dreams, 3),
+                    "BIZARRE_DREAM": (self.bizarre_dream_combinations, 1),
                 },
                 is_time_consuming=False,
                 is_difficult=True,
@@ -174,54 +181,63 @@ class GunfireRebornGame(Game):
                 ]
             )
 
-        return templates
+        return [template for template in templates if self.is_feasible(template)]
+
+    @staticmethod
+    def is_feasible(template: GameObjectiveTemplate) -> bool:
+        # Only fixed integer counts can be checked up front; any other count is left to the host.
+        return all(
+            len(collection()) >= count
+            for collection, count in template.data.values()
+            if isinstance(count, int)
+        )
 
     @property
     def dlc_owned(self) -> List[str]:
         return sorted(self.archipelago_options.gunfire_reborn_dlc_owned.value)
     
-    @property
-    def has_dlc_1(self) -> bool:
-        return "Visitors of Spirit Realm" in self.dlc_owned
-    
-    @property
-    def has_dlc_2(self) -> bool:
-        return "Artisan and Magician" in self.dlc_owned
-    
-    @property
-    def has_dlc_3(self) -> bool:
-        return "Realm of Frost and Inkwash" in self.dlc_owned
-
     @property
     def spiritual_assault_enabled(self) -> bool:
         return bool(self.archipelago_options.gunfire_reborn_include_spiritual_assault.value)
+
+    @functools.cached_property
+    def excluded_characters(self) -> FrozenSet[str]:
+        return frozenset(self.archipelago_options.gunfire_reborn_excluded_characters.value)
+
+    @functools.cached_property
+    def excluded_weapons(self) -> FrozenSet[str]:
+        return frozenset(self.archipelago_options.gunfire_reborn_excluded_weapons.value)
+
+    @functools.cached_property
+    def excluded_maps(self) -> FrozenSet[str]:
+        return frozenset(self.archipelago_options.gunfire_reborn_excluded_maps.value)
     
     @staticmethod
-    def difficulty_normal() -> List[str]:
-        return [
+    def difficulty_normal() -> Tuple[str, ...]:
+        return (
             "Normal",
             "Expert",
-        ]
+        )
     
     @staticmethod
-    def difficulty_hard() -> List[str]:
-        return [
+    def difficulty_hard() -> Tuple[str, ...]:
+        return (
             "Nightmare",
-            "Reincarnation"
-        ]
+            "Reincarnation",
+        )
     
     @staticmethod
-    def all_difficulties() -> List[str]:
-        return [
+    def all_difficulties() -> Tuple[str, ...]:
+        return (
             "Normal",
             "Expert",
             "Nightmare",
-            "Reincarnation"
-        ]
+            "Reincarnation",
+        )
 
     @staticmethod
-    def bizarre_dreams() -> List[str]:
-        return [
+    def bizarre_dreams() -> Tuple[str, ...]:
+        return (
             "Spiritual Link",
             "Mysterious Jokul",
             "Lone Wolf",
@@ -229,65 +245,80 @@ class GunfireRebornGame(Game):
             "Transcendent Arsenal",
             "Ascension Fusion",
             "Mission From Above",
-        ]
+        )
     
+    bizarre_dream_triples: Tuple[str, ...] = tuple(
+        ", ".join(combination)
+        for combination in itertools.combinations(bizarre_dreams.__func__(), 3)
+    )
+
+    def bizarre_dream_combinations(self) -> Tuple[str, ...]:
+        return self.bizarre_dream_triples
+
     @staticmethod
-    def spiritual_assault_maps() -> List[str]:
-        return [
+    def spiritual_assault_maps_base() -> Tuple[str, ...]:
+        return (
             "Desert Frontier",
-            "Mid Fjord"
-        ]
+            "Mid Fjord",
+        )
 
     @functools.cached_property
-    def characters_base(self) -> List[str]:
-        return [
+    def spiritual_assault_maps_available(self) -> Tuple[str, ...]:
+        return tuple(map_name for map_name in self.spiritual_assault_maps_base() if map_name not in self.excluded_maps)
+
+    def spiritual_assault_maps(self) -> Tuple[str, ...]:
+        return self.spiritual_assault_maps_available
+
+    @staticmethod
+    def characters_base() -> Tuple[str, ...]:
+        return (
             "Crown Prince",
             "Ao Bai",
             "Qing Yan",
             "Lei Luo",
             "Tao",
             "Qian Sui",
-        ]
+        )
     
-    @functools.cached_property
-    def characters_dlc_1(self) -> List[str]:
-        return [
+    characters_dlc: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+        "Visitors of Spirit Realm": (
             "Xing Zhe",
             "Li",
-        ]
-    
-    @functools.cached_property
-    def characters_dlc_2(self) -> List[str]:
-        return [
+        ),
+        "Artisan and Magician": (
             "Zi Xiao",
             "Nona",
-        ]
-    
-    @functools.cached_property
-    def characters_dlc_3(self) -> List[str]:
-        return [
+        ),
+        "Realm of Frost and Inkwash": (
             "Lyn",
             "Momo",
-        ]
+        ),
+    })
 
-    def characters(self) -> List[str]:
-        characters: List[str] = self.characters_base
+    @functools.cached_property
+    def characters_owned(self) -> Tuple[str, ...]:
+        characters: List[str] = list(self.characters_base())
 
-        if self.has_dlc_1:
-            characters.extend(self.characters_dlc_1)
+        for dlc in self.dlc_owned:
+            characters.extend(self.characters_dlc[dlc])
 
-        if self.has_dlc_2:
-            characters.extend(self.characters_dlc_2)
+        return tuple(sorted(set(characters) - self.excluded_characters))
 
-        if self.has_dlc_3:
-            characters.extend(self.characters_dlc_3)
-        
-        return sorted(characters)
-    
+    def characters(self) -> Tuple[str, ...]:
+        return self.characters_owned
 
     @staticmethod
-    def weapon_types() -> List[str]:
-        return [
+    def characters_catalog() -> Tuple[str, ...]:
+        characters: List[str] = list(GunfireRebornGame.characters_base())
+
+        for dlc_characters in GunfireRebornGame.characters_dlc.values():
+            characters.extend(dlc_characters)
+
+        return tuple(sorted(characters))
+
+    @staticmethod
+    def weapon_types_base() -> Tuple[str, ...]:
+        return (
             "Rifle",
             "Submachine Gun",
             "Pistol",
@@ -296,129 +327,132 @@ class GunfireRebornGame(Game):
             "Launcher",
             "Injector",
             "Melee",
-            "Staff"
-        ]
+            "Staff",
+        )
 
     @functools.cached_property
-    def weapons_rifle_base(self) -> List[str]:
-        return [
+    def weapon_types_available(self) -> Tuple[str, ...]:
+        return tuple(weapon_type for weapon_type in self.weapon_types_base() if self.weapons_owned[weapon_type])
+
+    def weapon_types(self) -> Tuple[str, ...]:
+        return self.weapon_types_available
+
+    weapons_dlc: Mapping[str, Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+        "Visitors of Spirit Realm": MappingProxyType({
+            "Rifle": (
+                "Hexagon",
+            ),
+            "Pistol": (
+                "Arc Light",
+                "Cloud Weaver",
+            ),
+            "Sniper": (
+                "Lighting Ksana",
+            ),
+        }),
+        "Artisan and Magician": MappingProxyType({
+            "Submachine Gun": (
+                "Wolf Gaze",
+            ),
+            "Pistol": (
+                "Star Ring",
+            ),
+            "Sniper": (
+                "Brick",
+            ),
+            "Injector": (
+                "Jet Octopus",
+            ),
+        }),
+        "Realm of Frost and Inkwash": MappingProxyType({
+            "Rifle": (
+                "Tracker",
+            ),
+            "Launcher": (
+                "Tempest",
+            ),
+            "Staff": (
+                "Phoenix Roar",
+                "Starfly",
+            ),
+        }),
+    })
+
+    @staticmethod
+    def weapons_base() -> Dict[str, Tuple[str, ...]]:
+        return {
+            "Rifle": GunfireRebornGame.weapons_rifle_base(),
+            "Submachine Gun": GunfireRebornGame.weapons_smg_base(),
+            "Pistol": GunfireRebornGame.weapons_pistol_base(),
+            "Shotgun": GunfireRebornGame.weapons_shotgun_base(),
+            "Sniper": GunfireRebornGame.weapons_sniper_base(),
+            "Launcher": GunfireRebornGame.weapons_launcher_base(),
+            "Injector": GunfireRebornGame.weapons_injector_base(),
+            "Melee": GunfireRebornGame.weapons_melee_base(),
+            "Staff": GunfireRebornGame.weapons_staff_base(),
+        }
+
+    @functools.cached_property
+    def weapons_owned(self) -> Mapping[str, Tuple[str, ...]]:
+        weapons: Dict[str, List[str]] = {
+            weapon_type: list(type_weapons) for weapon_type, type_weapons in self.weapons_base().items()
+        }
+
+        for dlc in self.dlc_owned:
+            for weapon_type, dlc_weapons in self.weapons_dlc[dlc].items():
+                weapons[weapon_type].extend(dlc_weapons)
+
+        return MappingProxyType({
+            weapon_type: tuple(sorted(set(type_weapons) - self.excluded_weapons))
+            for weapon_type, type_weapons in weapons.items()
+        })
+
+    @staticmethod
+    def weapons_rifle_base() -> Tuple[str, ...]:
+        return (
             "Big Hippo",
             "Cavalry",
             "Crimson Firescale",
             "Dragonchaser",
             "Lightning Blast",
             "Rainbow Arch",
-        ]
-    
-    @functools.cached_property
-    def weapons_rifle_dlc_1(self) -> List[str]:
-        return [
-            "Hexagon"
-        ]
-    
-    @functools.cached_property
-    def weapons_rifle_dlc_2(self) -> List[str]:
-        return list()
-
-    @functools.cached_property
-    def weapons_rifle_dlc_3(self) -> List[str]:
-        return [
-            "Tracker"
-        ]
-    
-    def weapons_rifle(self) -> List[str]:
-        weapons: List[str] = self.weapons_rifle_base[:]
+        )
 
-        if self.has_dlc_1:
-            weapons.extend(self.weapons_rifle_dlc_1)
-        if self.has_dlc_2:
-            weapons.extend(self.weapons_rifle_dlc_2)
-        if self.has_dlc_3:
-            weapons.extend(self.weapons_rifle_dlc_3)
+    def weapons_rifle(self) -> Tuple[str, ...]:
+        return self.weapons_owned["Rifle"]
 
-        return sorted(weapons)
-    
-    @functools.cached_property
-    def weapons_smg_base(self) -> List[str]:
-        return [
+    @staticmethod
+    def weapons_smg_base() -> Tuple[str, ...]:
+        return (
             "Angelic Aura",
             "Concealed Ammo",
             "Demonlore",
             "Dual Fang",
             "Scalpel",
-            "Star Devourer"
-        ]
-    
-    @functools.cached_property
-    def weapons_smg_dlc_1(self) -> List[str]:
-        return list()
-    
-    @functools.cached_property
-    def weapons_smg_dlc_2(self) -> List[str]:
-        return [
-            "Wolf Gaze"
-        ]
-    
-    @functools.cached_property
-    def weapons_smg_dlc_3(self) -> List[str]:
-        return list()
+            "Star Devourer",
+        )
 
-    def weapons_smg(self) -> List[str]:
-        weapons: List[str] = self.weapons_smg_base[:]
+    def weapons_smg(self) -> Tuple[str, ...]:
+        return self.weapons_owned["Submachine Gun"]
 
-        if self.has_dlc_1:
-            weapons.extend(self.weapons_smg_dlc_1)
-        if self.has_dlc_2:
-            weapons.extend(self.weapons_smg_dlc_2)
-        if self.has_dlc_3:
-            weapons.extend(self.weapons_smg_dlc_3)
-
-        return sorted(weapons)
-    
-    @functools.cached_property
-    def weapons_pistol_base(self) -> List[str]:
-        return[
+    @staticmethod
+    def weapons_pistol_base() -> Tuple[str, ...]:
+        return (
             "Aura of Venom",
             "Glimmering",
             "Icy Spear",
             "Prism",
             "Scorching Rounds",
             "Sunder",
-            "Talisman"
-        ]
-    
-    @functools.cached_property
-    def weapons_pistol_dlc_1(self) -> List[str]:
-        return [
-            "Arc Light",
-            "Cloud Weaver"
-        ]
-    
-    @functools.cached_property
-    def weapons_pistol_dlc_2(self) -> List[str]:
-        return [
-            "Star Ring"
-        ]
-    
-    @functools.cached_property
-    def weapons_pistol_dlc_3(self) -> List[str]:
-        return list()
-    
-    def weapons_pistol(self) -> List[str]:
-        weapons: List[str] = self.weapons_pistol_base[:]
+            "Talisman",
+        )
 
-        if self.has_dlc_1:
-            weapons.extend(self.weapons_pistol_dlc_1)
-        if self.has_dlc_2:
-            weapons.extend(self.weapons_pistol_dlc_2)
-        if self.has_dlc_3:
-            weapons.extend(self.weapons_pistol_dlc_3)
+    def weapons_pistol(self) -> Tuple[str, ...]:
+        return self.weapons_owned["Pistol"]
 
-        return sorted(weapons)
-
-    @functools.cached_property
-    def weapons_shotgun_base(self) -> List[str]:
-        return [
+    @staticmethod
+    def weapons_shotgun_base() -> Tuple[str, ...]:
+        return (
             "Argus",
             "Hell",
             "Illusion",
@@ -426,35 +460,14 @@ class GunfireRebornGame(Game):
             "Pupil",
             "Wheel Saw",
             "Wild Hunt",
-        ]
-    
-    @functools.cached_property
-    def weapons_shotgun_dlc_1(self) -> List[str]:
-        return list()
-    
-    @functools.cached_property
-    def weapons_shotgun_dlc_2(self) -> List[str]:
-        return list()
-    
-    @functools.cached_property
-    def weapons_shotgun_dlc_3(self) -> List[str]:
-        return list()
-
-    def weapons_shotgun(self) -> List[str]:
-        weapons: List[str] = self.weapons_shotgun_base[:]
+        )
 
-        if self.has_dlc_1:
-            weapons.extend(self.weapons_shotgun_dlc_1)
-        if self.has_dlc_2:
-            weapons.extend(self.weapons_shotgun_dlc_2)
-        if self.has_dlc_3:
-            weapons.extend(self.weapons_shotgun_dlc_3)
+    def weapons_shotgun(self) -> Tuple[str, ...]:
+        return self.weapons_owned["Shotgun"]
 
-        return sorted(weapons)
-    
-    @functools.cached_property
-    def weapons_sniper_base(self) -> List[str]:
-        return [
+    @staticmethod
+    def weapons_sniper_base() -> Tuple[str, ...]:
+        return (
             "Bloody Drill",
             "Double Caliber",
             "Golden Bow",
@@ -463,39 +476,14 @@ class GunfireRebornGame(Game):
             "Sting",
             "Strike Wing",
             "Woodpecker",
-        ]
-    
-    @functools.cached_property
-    def weapons_sniper_dlc_1(self) -> List[str]:
-        return [
-            "Lighting Ksana"
-        ]
-    
-    @functools.cached_property
-    def weapons_sniper_dlc_2(self) -> List[str]:
-        return [
-            "Brick"
-        ]
-    
-    @functools.cached_property
-    def weapons_sniper_dlc_3(self) -> List[str]:
-        return list()
-    
-    def weapons_sniper(self) -> List[str]:
-        weapons: List[str] = self.weapons_sniper_base[:]
-
-        if self.has_dlc_1:
-            weapons.extend(self.weapons_sniper_dlc_1)
-        if self.has_dlc_2:
-            weapons.extend(self.weapons_sniper_dlc_2)
-        if self.has_dlc_3:
-            weapons.extend(self.weapons_sniper_dlc_3)
+        )
 
-        return sorted(weapons)
+    def weapons_sniper(self) -> Tuple[str, ...]:
+        return self.weapons_owned["Sniper"]
 
-    @functools.cached_property
-    def weapons_launcher_base(self) -> List[str]:
-        return [
+    @staticmethod
+    def weapons_launcher_base() -> Tuple[str, ...]:
+        return (
             "Bone Dragon",
             "Deafening Mortar",
             "Dragon Breath",
@@ -504,152 +492,71 @@ class GunfireRebornGame(Game):
             "Shrieker",
             "Thunder Storm",
             "Tiger Cannon",
-        ]
-    
-    @functools.cached_property
-    def weapons_launcher_dlc_1(self) -> List[str]:
-        return list()
-    
-    @functools.cached_property
-    def weapons_launcher_dlc_2(self) -> List[str]:
-        return list()
-    
-    @functools.cached_property
-    def weapons_launcher_dlc_3(self) -> List[str]:
-        return [
-            "Tempest"
-        ]
-    
-    def weapons_launcher(self) -> List[str]:
-        weapons: List[str] = self.weapons_launcher_base[:]
-
-        if self.has_dlc_1:
-            weapons.extend(self.weapons_launcher_dlc_1)
-        if self.has_dlc_2:
-            weapons.extend(self.weapons_launcher_dlc_2)
-        if self.has_dlc_3:
-            weapons.extend(self.weapons_launcher_dlc_3)
+        )
 
-        return sorted(weapons)
+    def weapons_launcher(self) -> Tuple[str, ...]:
+        return self.weapons_owned["Launcher"]
 
-    @functools.cached_property
-    def weapons_injector_base(self) -> List[str]:
-        return [
+    @staticmethod
+    def weapons_injector_base() -> Tuple[str, ...]:
+        return (
             "Clawspray",
             "Fire Dragon",
             "Laser Gloves",
             "Radioactive Gauntlet",
             "Rainbow",
-            "Thunderclap Gloves"
-        ]
-    
-    @functools.cached_property
-    def weapons_injector_dlc_1(self) -> List[str]:
-        return list()
-    
-    @functools.cached_property
-    def weapons_injector_dlc_2(self) -> List[str]:
-        return [
-            "Jet Octopus"
-        ]
-    
-    @functools.cached_property
-    def weapons_injector_dlc_3(self) -> List[str]:
-        return list()
-    
-    def weapons_injector(self) -> List[str]:
-        weapons: List[str] = self.weapons_injector_base[:]
+            "Thunderclap Gloves",
+        )
 
-        if self.has_dlc_1:
-            weapons.extend(self.weapons_injector_dlc_1)
-        if self.has_dlc_2:
-            weapons.extend(self.weapons_injector_dlc_2)
-        if self.has_dlc_3:
-            weapons.extend(self.weapons_injector_dlc_3)
+    def weapons_injector(self) -> Tuple[str, ...]:
+        return self.weapons_owned["Injector"]
 
-        return sorted(weapons)
-
-    @functools.cached_property
-    def weapons_melee_base(self) -> List[str]:
-        return [
+    @staticmethod
+    def weapons_melee_base() -> Tuple[str, ...]:
+        return (
             "Fire Tower",
             "Flowing Light",
             "Poisonous Ghost",
-            "Storm Chaser"
-        ]
-    
-    @functools.cached_property
-    def weapons_melee_dlc_1(self) -> List[str]:
-        return list()
-    
-    @functools.cached_property
-    def weapons_melee_dlc_2(self) -> List[str]:
-        return list()
-    
-    @functools.cached_property
-    def weapons_melee_dlc_3(self) -> List[str]:
-        return list()
-    
-    def weapons_melee(self) -> List[str]:
-        weapons: List[str] = self.weapons_melee_base[:]
+            "Storm Chaser",
+        )
 
-        if self.has_dlc_1:
-            weapons.extend(self.weapons_melee_dlc_1)
-        if self.has_dlc_2:
-            weapons.extend(self.weapons_melee_dlc_2)
-        if self.has_dlc_3:
-            weapons.extend(self.weapons_melee_dlc_3)
+    def weapons_melee(self) -> Tuple[str, ...]:
+        return self.weapons_owned["Melee"]
 
-        return sorted(weapons)
+    @staticmethod
+    def weapons_staff_base() -> Tuple[str, ...]:
+        return (
+            "Crane Chant",
+        )
+
+    def weapons_staff(self) -> Tuple[str, ...]:
+        return self.weapons_owned["Staff"]
 
     @functools.cached_property
-    def weapons_staff_base(self) -> List[str]:
-        return [
-            "Crane Chant"
-        ]
-    
-    @functools.cached_property
-    def weapons_staff_dlc_1(self) -> List[str]:
-        return list()
-    
-    @functools.cached_property
-    def weapons_staff_dlc_2(self) -> List[str]:
-        return list()
-    
-    @functools.cached_property
-    def weapons_staff_dlc_3(self) -> List[str]:
-        return [
-            "Phoenix Roar",
-            "Starfly"
-        ]
-    
-    def weapons_staff(self) -> List[str]:
-        weapons: List[str] = self.weapons_staff_base[:]
+    def all_weapons_owned(self) -> Tuple[str, ...]:
+        weapons: List[str] = list()
 
-        if self.has_dlc_1:
-            weapons.extend(self.weapons_staff_dlc_1)
-        if self.has_dlc_2:
-            weapons.extend(self.weapons_staff_dlc_2)
-        if self.has_dlc_3:
-            weapons.extend(self.weapons_staff_dlc_3)
+        for type_weapons in self.weapons_owned.values():
+            weapons.extend(type_weapons)
 
-        return sorted(weapons)
-    
-    def all_weapons(self) -> List[str]:
+        return tuple(sorted(weapons))
+
+    def all_weapons(self) -> Tuple[str, ...]:
+        return self.all_weapons_owned
+
+    @staticmethod
+    def weapons_catalog() -> Tuple[str, ...]:
         weapons: List[str] = list()
 
-        weapons.extend(self.weapons_rifle())
-        weapons.extend(self.weapons_smg())
-        weapons.extend(self.weapons_pistol())
-        weapons.extend(self.weapons_shotgun())
-        weapons.extend(self.weapons_sniper())
-        weapons.extend(self.weapons_launcher())
-        weapons.extend(self.weapons_injector())
-        weapons.extend(self.weapons_melee())
-        weapons.extend(self.weapons_staff())
-        
-        return sorted(weapons)
-   
+        for type_weapons in GunfireRebornGame.weapons_base().values():
+            weapons.extend(type_weapons)
+
+        for dlc_weapons in GunfireRebornGame.weapons_dlc.values():
+            for type_weapons in dlc_weapons.values():
+                weapons.extend(type_weapons)
+
+        return tuple(sorted(weapons))
+
 
 #####################
 # Archipelago Options
@@ -672,4 +579,25 @@ class GunfireRebornIncludeSpiritualAssault(Toggle):
     """
     Indicates whether or not to include Gunfire Reborn Spiritual Assault when generating objectives.
     """
-    display_name = "Gunfire Reborn Include Spiritual Assault"
\ No newline at end of file
+    display_name = "Gunfire Reborn Include Spiritual Assault"
+
+class GunfireRebornExcludedCharacters(OptionSet):
+    """
+    Indicates which Gunfire Reborn characters should never be picked when generating objectives.
+    """
+    display_name = "Gunfire Reborn Excluded Characters"
+    valid_keys = list(GunfireRebornGame.characters_catalog())
+
+class GunfireRebornExcludedWeapons(OptionSet):
+    """
+    Indicates which Gunfire Reborn weapons should never be picked when generating objectives.
+    """
+    display_name = "Gunfire Reborn Excluded Weapons"
+    valid_keys = list(GunfireRebornGame.weapons_catalog())
+
+class GunfireRebornExcludedMaps(OptionSet):
+    """
+    Indicates which Gunfire Reborn Spiritual Assault maps should never be picked when generating objectives.
+    """
+    display_name = "Gunfire Reborn Excluded Maps"
+    valid_keys = list(GunfireRebornGame.spiritual_assault_maps_base())
\ No newline at end of file
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import functools
-from typing import List
+from types import MappingProxyType
+from typing import FrozenSet, List, Mapping, Tuple
 
 from dataclasses import dataclass
 
-from Options import Toggle
+from Options import Toggle, OptionSet
 
 from ..game import Game
 from ..game_objective_template import GameObjectiveTemplate
@@ -17,6 +18,8 @@ from ..enums import KeymastersKeepGamePlatforms
 class TeamFortress2ArchipelagoOptions:
     team_fortress_2_include_alternate_game_modes: TeamFortress2IncludeAlternateGameModes
     team_fortress_2_include_mann_vs_machine: TeamFortress2IncludeMannVsMachine
+    team_fortress_2_excluded_maps: TeamFortress2ExcludedMaps
+    team_fortress_2_excluded_weapons: TeamFortress2ExcludedWeapons
 
 class TeamFortress2Game(Game):
     name = "Team Fortress 2"
@@ -29,7 +32,7 @@ class TeamFortress2Game(Game):
     options_cls = TeamFortress2ArchipelagoOptions
 
     def optional_game_constraint_templates(self) -> List[GameObjectiveTemplate]:
-        return [
+        templates: List[GameObjectiveTemplate] = [
             GameObjectiveTemplate(
                 label="Cannot use the following weapons (unless required): WEAPONS",
                 data={
@@ -42,6 +45,8 @@ class TeamFortress2Game(Game):
             ),
         ]
 
+        return [template for template in templates if self.is_feasible(template)]
+
     def game_objective_templates(self) -> List[GameObjectiveTemplate]:
         templates: List[GameObjectiveTemplate] = [
             GameObjectiveTemplate(
@@ -279,7 +284,16 @@ class TeamFortress2Game(Game):
                 ]
             )
 
-        return templates
+        return [template for template in templates if self.is_feasible(template)]
+
+    @staticmethod
+    def is_feasible(template: GameObjectiveTemplate) -> bool:
+        # Only fixed integer counts can be checked up front; any other count is left to the host.
+        return all(
+            len(collection()) >= count
+            for collection, count in template.data.values()
+            if isinstance(count, int)
+        )
 
     @property
     def alternate_gamemodes_enabled(self) -> bool:
@@ -289,9 +303,52 @@ class TeamFortress2Game(Game):
     def mann_vs_machine_enabled(self) -> bool:
         return bool(self.archipelago_options.team_fortress_2_include_mann_vs_machine.value)
 
-    
-    def classes(self) -> List[str]:
-        return [
+    @functools.cached_property
+    def excluded_maps(self) -> FrozenSet[str]:
+        return frozenset(self.archipelago_options.team_fortress_2_excluded_maps.value)
+
+    @functools.cached_property
+    def excluded_weapons(self) -> FrozenSet[str]:
+        return frozenset(self.archipelago_options.team_fortress_2_excluded_weapons.value)
+
+    @functools.cached_property
+    def loadout_pools(self) -> Mapping[str, Tuple[str, ...]]:
+        return MappingProxyType({
+            "scout_primary": self.without_excluded_weapons(self.scout_primary_base()),
+            "scout_secondary": self.without_excluded_weapons(self.scout_secondary_base()),
+            "scout_melee": self.without_excluded_weapons(self.scout_melee_base()),
+            "soldier_primary": self.without_excluded_weapons(self.soldier_primary_base()),
+            "soldier_secondary": self.without_excluded_weapons(self.soldier_secondary_base()),
+            "soldier_melee": self.without_excluded_weapons(self.soldier_melee_base()),
+            "pyro_primary": self.without_excluded_weapons(self.pyro_primary_base()),
+            "pyro_secondary": self.without_excluded_weapons(self.pyro_secondary_base()),
+            "pyro_melee": self.without_excluded_weapons(self.pyro_melee_base()),
+            "demo_primary": self.without_excluded_weapons(self.demo_primary_base()),
+            "demo_secondary": self.without_excluded_weapons(self.demo_secondary_base()),
+            "demo_melee": self.without_excluded_weapons(self.demo_melee_base()),
+            "heavy_primary": self.without_excluded_weapons(self.heavy_primary_base()),
+            "heavy_secondary": self.without_excluded_weapons(self.heavy_secondary_base()),
+            "heavy_melee": self.without_excluded_weapons(self.heavy_melee_base()),
+            "engineer_primary": self.without_excluded_weapons(self.engineer_primary_base()),
+            "engineer_secondary": self.without_excluded_weapons(self.engineer_secondary_base()),
+            "engineer_melee": self.without_excluded_weapons(self.engineer_melee_base()),
+            "medic_primary": self.without_excluded_weapons(self.medic_primary_base()),
+            "medic_secondary": self.without_excluded_weapons(self.medic_secondary_base()),
+            "medic_melee": self.without_excluded_weapons(self.medic_melee_base()),
+            "sniper_primary": self.without_excluded_weapons(self.sniper_primary_base()),
+            "sniper_secondary": self.without_excluded_weapons(self.sniper_secondary_base()),
+            "sniper_melee": self.without_excluded_weapons(self.sniper_melee_base()),
+            "spy_primary": self.without_excluded_weapons(self.spy_primary_base()),
+            "spy_secondary": self.without_excluded_weapons(self.spy_secondary_base()),
+            "spy_melee": self.without_excluded_weapons(self.spy_melee_base()),
+            "spy_watch": self.without_excluded_weapons(self.spy_watch_base()),
+        })
+
+    def without_excluded_weapons(self, weapons: Tuple[str, ...]) -> Tuple[str, ...]:
+        return tuple(weapon for weapon in weapons if weapon not in self.excluded_weapons)
+
+    def classes(self) -> Tuple[str, ...]:
+        return (
             "Scout",
             "Soldier",
             "Pyro",
@@ -301,11 +358,12 @@ class TeamFortress2Game(Game):
             "Medic",
             "Sniper",
             "Spy",
-        ]
+        )
 
     
-    def main_maps(self) -> List[str]:
-        return [
+    @staticmethod
+    def main_maps_base() -> Tuple[str, ...]:
+        return (
             "2Fort",
             "2Fort Invasion",
             "Applejack",
@@ -395,72 +453,109 @@ class TeamFortress2Game(Game):
             "Thunder Mountain (Payload)",
             "Upward",
             "Venice",
-        ]
+        )
+
+    @functools.cached_property
+    def main_maps_available(self) -> Tuple[str, ...]:
+        return tuple(map_name for map_name in self.main_maps_base() if map_name not in self.excluded_maps)
+
+    def main_maps(self) -> Tuple[str, ...]:
+        return self.main_maps_available
+
+    @staticmethod
+    def maps_catalog() -> Tuple[str, ...]:
+        maps: List[str] = list(TeamFortress2Game.main_maps_base())
+
+        maps.extend(TeamFortress2Game.mann_vs_machine_main_maps_base())
+        maps.extend(TeamFortress2Game.mann_vs_machine_expert_maps_base())
+
+        return tuple(sorted(maps))
 
     
-    def main_gamemodes(self) -> List[str]:
-        return [
+    def main_gamemodes(self) -> Tuple[str, ...]:
+        return (
             "Attack/Defend",
             "Capture the Flag",
             "Control Points",
             "King of the Hill",
             "Payload",
-        ]
+        )
     
-    def alternate_gamemodes(self) -> List[str]:
-        return [
+    def alternate_gamemodes(self) -> Tuple[str, ...]:
+        return (
             "Payload Race",
             "Misc.",
             "Mannpower",
             "PASS Time",
-        ]
+        )
 
     
-    def mann_vs_machine_main_maps(self) -> List[str]:
-        return[
+    @staticmethod
+    def mann_vs_machine_main_maps_base() -> Tuple[str, ...]:
+        return (
             "Bigrock",
             "Coal Town",
             "Decoy",
             "Mannhattan",
             "Rottenburg",
-        ]
+        )
+
+    @functools.cached_property
+    def mann_vs_machine_main_maps_available(self) -> Tuple[str, ...]:
+        return tuple(map_name for map_name in self.mann_vs_machine_main_maps_base() if map_name not in self.excluded_maps)
+
+    def mann_vs_machine_main_maps(self) -> Tuple[str, ...]:
+        return self.mann_vs_machine_main_maps_available
 
     
-    def mann_vs_machine_main_tours(self) -> List[str]:
-        return[
+    def mann_vs_machine_main_tours(self) -> Tuple[str, ...]:
+        return (
             "Operation Oil Spill",
             "Operation Steel Trap",
             "Operation Mecha Engie",
             "Operation Two Cities",
-        ]
+        )
 
     
-    def mann_vs_machine_expert_maps(self) -> List[str]:
-        return [
+    @staticmethod
+    def mann_vs_machine_expert_maps_base() -> Tuple[str, ...]:
+        return (
             "Mannworks",
-        ]
+        )
+
+    @functools.cached_property
+    def mann_vs_machine_expert_maps_available(self) -> Tuple[str, ...]:
+        return tuple(map_name for map_name in self.mann_vs_machine_expert_maps_base() if map_name not in self.excluded_maps)
+
+    def mann_vs_machine_expert_maps(self) -> Tuple[str, ...]:
+        return self.mann_vs_machine_expert_maps_available
 
     
-    def mann_vs_machine_expert_tours(self) -> List[str]:
-        return [
+    def mann_vs_machine_expert_tours(self) -> Tuple[str, ...]:
+        return (
             "Operation Gear Grinder",
-        ]
+        )
 
 
     
-    def scout_primary(self) -> List[str]:
-        return [
+    @staticmethod
+    def scout_primary_base() -> Tuple[str, ...]:
+        return (
             "Scattergun",
             "Force-A-Nature",
             "Shortstop",
             "Soda Popper",
             "Baby Face's Blaster",
             "Back Scatter",
-        ]
+        )
+
+    def scout_primary(self) -> Tuple[str, ...]:
+        return self.loadout_pools["scout_primary"]
 
     
-    def scout_secondary(self) -> List[str]:
-        return [
+    @staticmethod
+    def scout_secondary_base() -> Tuple[str, ...]:
+        return (
             "Pistol",
             "Winger",
             "Pretty Boy's Pocket Pistol",
@@ -468,12 +563,16 @@ class TeamFortress2Game(Game):
             "Bonk! Atomic Punch",
             "Crit-a-Cola",
             "Mad Milk",
-        ]
+        )
+
+    def scout_secondary(self) -> Tuple[str, ...]:
+        return self.loadout_pools["scout_secondary"]
 
 
     
-    def scout_melee(self) -> List[str]:
-        return [
+    @staticmethod
+    def scout_melee_base() -> Tuple[str, ...]:
+        return (
             "Bat",
             "Holy Mackerel",
             "Sandman",
@@ -483,12 +582,16 @@ class TeamFortress2Game(Game):
             "Fan O'War",
             "Atomizer",
             "Wrap Assassin",
-        ]
+        )
+
+    def scout_melee(self) -> Tuple[str, ...]:
+        return self.loadout_pools["scout_melee"]
 
 
     
-    def soldier_primary(self) -> List[str]:
-        return [
+    @staticmethod
+    def soldier_primary_base() -> Tuple[str, ...]:
+        return (
             "Rocket Launcher",
             "Original",
             "Direct Hit",
@@ -498,11 +601,15 @@ class TeamFortress2Game(Game):
             "Cow Mangler 5000",
             "Beggar's Bazooka",
             "Air Strike",
-        ]
+        )
+
+    def soldier_primary(self) -> Tuple[str, ...]:
+        return self.loadout_pools["soldier_primary"]
 
     
-    def soldier_secondary(self) -> List[str]:
-        return [
+    @staticmethod
+    def soldier_secondary_base() -> Tuple[str, ...]:
+        return (
             "Shotgun",
             "Reserve Shooter",
             "Buff Banner",
@@ -512,11 +619,15 @@ class TeamFortress2Game(Game):
             "Mantreads",
             "Righteous Bison",
             "B.A.S.E. Jumper",
-        ]
+        )
+
+    def soldier_secondary(self) -> Tuple[str, ...]:
+        return self.loadout_pools["soldier_secondary"]
 
     
-    def soldier_melee(self) -> List[str]:
-        return [
+    @staticmethod
+    def soldier_melee_base() -> Tuple[str, ...]:
+        return (
             "Shovel",
             "Equalizer",
             "Pain Train",
@@ -524,23 +635,31 @@ class TeamFortress2Game(Game):
             "Disciplinary Action",
             "Market Gardener",
             "Escape Plan",
-        ]
+        )
+
+    def soldier_melee(self) -> Tuple[str, ...]:
+        return self.loadout_pools["soldier_melee"]
 
 
     
-    def pyro_primary(self) -> List[str]:
-        return [
+    @staticmethod
+    def pyro_primary_base() -> Tuple[str, ...]:
+        return (
             "Flame Thrower",
             "Rainblower",
             "Backburner",
             "Degreaser",
             "Phlogistinator",
             "Dragon's Fury",
-        ]
+        )
+
+    def pyro_primary(self) -> Tuple[str, ...]:
+        return self.loadout_pools["pyro_primary"]
 
     
-    def pyro_secondary(self) -> List[str]:
-        return [
+    @staticmethod
+    def pyro_secondary_base() -> Tuple[str, ...]:
+        return (
             "Shotgun",
             "Reserve Shooter",
             "Flare Gun",
@@ -549,11 +668,15 @@ class TeamFortress2Game(Game):
             "Scorch Shot",
             "Thermal Thruster",
             "Gas Passer",
-        ]
+        )
+
+    def pyro_secondary(self) -> Tuple[str, ...]:
+        return self.loadout_pools["pyro_secondary"]
 
     
-    def pyro_melee(self) -> List[str]:
-        return [
+    @staticmethod
+    def pyro_melee_base() -> Tuple[str, ...]:
+        return (
             "Fire Axe",
             "Lollichop",
             "Axtinguisher",
@@ -564,24 +687,32 @@ class TeamFortress2Game(Game):
             "Sharpened Volcano Fragment",
             "Third Degree",
             "Neon Annihilator",
-            "Hot Hand"
-        ]
+            "Hot Hand",
+        )
+
+    def pyro_melee(self) -> Tuple[str, ...]:
+        return self.loadout_pools["pyro_melee"]
 
 
     
-    def demo_primary(self) -> List[str]:
-        return [
+    @staticmethod
+    def demo_primary_base() -> Tuple[str, ...]:
+        return (
             "Grenade Launcher",
             "Loch-n-Load",
             "Ali Baba's Wee Booties",
             "Bootlegger",
             "Loose Cannon",
             "B.A.S.E. Jumper",
-        ]
+        )
+
+    def demo_primary(self) -> Tuple[str, ...]:
+        return self.loadout_pools["demo_primary"]
 
     
-    def demo_secondary(self) -> List[str]:
-        return [
+    @staticmethod
+    def demo_secondary_base() -> Tuple[str, ...]:
+        return (
             "Stickybomb Launcher",
             "Scottish Resistance",
             "Chargin' Targe",
@@ -589,11 +720,15 @@ class TeamFortress2Game(Game):
             "Splendid Screen",
             "Tide Turner",
             "Quickiebomb Launcher",
-        ]
+        )
+
+    def demo_secondary(self) -> Tuple[str, ...]:
+        return self.loadout_pools["demo_secondary"]
 
     
-    def demo_melee(self) -> List[str]:
-        return [
+    @staticmethod
+    def demo_melee_base() -> Tuple[str, ...]:
+        return (
             "Bottle",
             "Scottish Handshake",
             "Eyelander",
@@ -604,33 +739,45 @@ class TeamFortress2Game(Game):
             "Claidheamh Mòr",
             "Half-Zatoichi",
             "Persian Persuader",
-        ]
+        )
+
+    def demo_melee(self) -> Tuple[str, ...]:
+        return self.loadout_pools["demo_melee"]
 
 
     
-    def heavy_primary(self) -> List[str]:
-        return [
+    @staticmethod
+    def heavy_primary_base() -> Tuple[str, ...]:
+        return (
             "Minigun",
             "Natascha",
             "Brass Beast",
             "Tomislav",
             "Huo-Long Heater",
-        ]
+        )
+
+    def heavy_primary(self) -> Tuple[str, ...]:
+        return self.loadout_pools["heavy_primary"]
 
     
-    def heavy_secondary(self) -> List[str]:
-        return [
+    @staticmethod
+    def heavy_secondary_base() -> Tuple[str, ...]:
+        return (
             "Shotgun",
             "Family Business",
             "Sandvich",
             "Dalokohs Bar",
             "Buffalo Steak Sandvich",
             "Second Banana",
-        ]
+        )
+
+    def heavy_secondary(self) -> Tuple[str, ...]:
+        return self.loadout_pools["heavy_secondary"]
 
     
-    def heavy_melee(self) -> List[str]:
-        return [
+    @staticmethod
+    def heavy_melee_base() -> Tuple[str, ...]:
+        return (
             "Fists",
             "Killing Gloves of Boxing",
             "Gloves of Running Urgently",
@@ -638,70 +785,98 @@ class TeamFortress2Game(Game):
             "Fists of Steel",
             "Eviction Notice",
             "Holiday Punch",
-        ]
+        )
+
+    def heavy_melee(self) -> Tuple[str, ...]:
+        return self.loadout_pools["heavy_melee"]
 
 
     
-    def engineer_primary(self) -> List[str]:
-        return [
+    @staticmethod
+    def engineer_primary_base() -> Tuple[str, ...]:
+        return (
             "Shotgun",
             "Frontier Justice",
             "Widowmaker",
             "Pomson 6000",
             "Rescue Ranger",
-        ]
+        )
+
+    def engineer_primary(self) -> Tuple[str, ...]:
+        return self.loadout_pools["engineer_primary"]
 
     
-    def engineer_secondary(self) -> List[str]:
-        return [
+    @staticmethod
+    def engineer_secondary_base() -> Tuple[str, ...]:
+        return (
             "Pistol",
             "Wrangler",
             "Short Circuit",
-        ]
+        )
+
+    def engineer_secondary(self) -> Tuple[str, ...]:
+        return self.loadout_pools["engineer_secondary"]
 
     
-    def engineer_melee(self) -> List[str]:
-        return [
+    @staticmethod
+    def engineer_melee_base() -> Tuple[str, ...]:
+        return (
             "Wrench",
             "Gunslinger",
             "Southern Hospitality",
             "Jag",
             "Eureka Effect",
-        ]
+        )
+
+    def engineer_melee(self) -> Tuple[str, ...]:
+        return self.loadout_pools["engineer_melee"]
 
 
     
-    def medic_primary(self) -> List[str]:
-        return [
+    @staticmethod
+    def medic_primary_base() -> Tuple[str, ...]:
+        return (
             "Syringe Gun",
             "Blutsauger",
             "Crusader's Crossbow",
             "Overdose",
-        ]
+        )
+
+    def medic_primary(self) -> Tuple[str, ...]:
+        return self.loadout_pools["medic_primary"]
 
     
-    def medic_secondary(self) -> List[str]:
-        return [
+    @staticmethod
+    def medic_secondary_base() -> Tuple[str, ...]:
+        return (
             "Medi Gun",
             "Kritzkrieg",
             "Quick-Fix",
             "Vaccinator",
-        ]
+        )
+
+    def medic_secondary(self) -> Tuple[str, ...]:
+        return self.loadout_pools["medic_secondary"]
 
     
-    def medic_melee(self) -> List[str]:
-        return [
+    @staticmethod
+    def medic_melee_base() -> Tuple[str, ...]:
+        return (
             "Bonesaw",
             "Ubersaw",
             "Vita-Saw",
             "Amputator",
             "Solemn Vow",
-        ]
+        )
+
+    def medic_melee(self) -> Tuple[str, ...]:
+        return self.loadout_pools["medic_melee"]
 
 
     
-    def sniper_primary(self) -> List[str]:
-        return [
+    @staticmethod
+    def sniper_primary_base() -> Tuple[str, ...]:
+        return (
             "Sniper Rifle",
             "Huntsman",
             "Fortified Compound",
@@ -710,95 +885,133 @@ class TeamFortress2Game(Game):
             "Machina",
             "Hitman's Heatmaker",
             "Classic",
-        ]
+        )
+
+    def sniper_primary(self) -> Tuple[str, ...]:
+        return self.loadout_pools["sniper_primary"]
 
     
-    def sniper_secondary(self) -> List[str]:
-        return [
+    @staticmethod
+    def sniper_secondary_base() -> Tuple[str, ...]:
+        return (
             "Submachine Gun",
             "Cleaner's Carbine",
             "Jarate",
             "Razorback",
             "Darwin's Danger Shield",
             "Cozy Camper",
-        ]
+        )
+
+    def sniper_secondary(self) -> Tuple[str, ...]:
+        return self.loadout_pools["sniper_secondary"]
 
     
-    def sniper_melee(self) -> List[str]:
-        return [
+    @staticmethod
+    def sniper_melee_base() -> Tuple[str, ...]:
+        return (
             "Kukri",
             "Tribalman's Shiv",
             "Bushwacka",
             "Shahanshah",
-        ]
+        )
+
+    def sniper_melee(self) -> Tuple[str, ...]:
+        return self.loadout_pools["sniper_melee"]
 
     
-    def spy_primary(self) -> List[str]:
-        return [
+    @staticmethod
+    def spy_primary_base() -> Tuple[str, ...]:
+        return (
             "Revolver",
             "Ambassador",
             "L'Etranger",
             "Enforcer",
-            "Diamondback", 
-        ]
+            "Diamondback",
+        )
+
+    def spy_primary(self) -> Tuple[str, ...]:
+        return self.loadout_pools["spy_primary"]
 
     
-    def spy_secondary(self) -> List[str]:
-        return [
+    @staticmethod
+    def spy_secondary_base() -> Tuple[str, ...]:
+        return (
             "Sapper",
             "Red-Tape Recorder",
-        ]
+        )
+
+    def spy_secondary(self) -> Tuple[str, ...]:
+        return self.loadout_pools["spy_secondary"]
 
     
-    def spy_melee(self) -> List[str]:
-        return [
+    @staticmethod
+    def spy_melee_base() -> Tuple[str, ...]:
+        return (
             "Knife",
             "Your Eternal Reward",
             "Conniver's Kunai",
             "Big Earner",
             "Spy-cicle",
-        ]
+        )
+
+    def spy_melee(self) -> Tuple[str, ...]:
+        return self.loadout_pools["spy_melee"]
 
     
-    def spy_watch(self) -> List[str]:
-        return [
+    @staticmethod
+    def spy_watch_base() -> Tuple[str, ...]:
+        return (
             "Invis Watch",
             "Cloak and Dagger",
             "Dead Ringer",
-        ]
+        )
+
+    def spy_watch(self) -> Tuple[str, ...]:
+        return self.loadout_pools["spy_watch"]
 
 
     
-    def all_weapons(self) -> List[str]:
+    @staticmethod
+    def weapons_catalog() -> Tuple[str, ...]:
         weaponsList: List[str] = list()
         
-        weaponsList.extend(self.scout_primary())
-        weaponsList.extend(self.scout_secondary())
-        weaponsList.extend(self.scout_melee())
-        weaponsList.extend(self.soldier_primary())     
-        weaponsList.extend(self.soldier_secondary())   
-        weaponsList.extend(self.soldier_melee())       
-        weaponsList.extend(self.pyro_primary())        
-        weaponsList.extend(self.pyro_secondary())      
-        weaponsList.extend(self.pyro_melee())          
-        weaponsList.extend(self.demo_primary())        
-        weaponsList.extend(self.demo_secondary())      
-        weaponsList.extend(self.demo_melee())          
-        weaponsList.extend(self.heavy_primary())       
-        weaponsList.extend(self.heavy_secondary())     
-        weaponsList.extend(self.heavy_melee())         
-        weaponsList.extend(self.medic_primary())       
-        weaponsList.extend(self.medic_secondary())     
-        weaponsList.extend(self.medic_melee())         
-        weaponsList.extend(self.sniper_primary())      
-        weaponsList.extend(self.sniper_secondary())    
-        weaponsList.extend(self.sniper_melee())        
-        weaponsList.extend(self.spy_primary())         
-        weaponsList.extend(self.spy_secondary())       
-        weaponsList.extend(self.spy_melee())           
-        weaponsList.extend(self.spy_watch())
-
-        return sorted(weaponsList)
+        weaponsList.extend(TeamFortress2Game.scout_primary_base())
+        weaponsList.extend(TeamFortress2Game.scout_secondary_base())
+        weaponsList.extend(TeamFortress2Game.scout_melee_base())
+        weaponsList.extend(TeamFortress2Game.soldier_primary_base())
+        weaponsList.extend(TeamFortress2Game.soldier_secondary_base())
+        weaponsList.extend(TeamFortress2Game.soldier_melee_base())
+        weaponsList.extend(TeamFortress2Game.pyro_primary_base())
+        weaponsList.extend(TeamFortress2Game.pyro_secondary_base())
+        weaponsList.extend(TeamFortress2Game.pyro_melee_base())
+        weaponsList.extend(TeamFortress2Game.demo_primary_base())
+        weaponsList.extend(TeamFortress2Game.demo_secondary_base())
+        weaponsList.extend(TeamFortress2Game.demo_melee_base())
+        weaponsList.extend(TeamFortress2Game.heavy_primary_base())
+        weaponsList.extend(TeamFortress2Game.heavy_secondary_base())
+        weaponsList.extend(TeamFortress2Game.heavy_melee_base())
+        weaponsList.extend(TeamFortress2Game.engineer_primary_base())
+        weaponsList.extend(TeamFortress2Game.engineer_secondary_base())
+        weaponsList.extend(TeamFortress2Game.engineer_melee_base())
+        weaponsList.extend(TeamFortress2Game.medic_primary_base())
+        weaponsList.extend(TeamFortress2Game.medic_secondary_base())
+        weaponsList.extend(TeamFortress2Game.medic_melee_base())
+        weaponsList.extend(TeamFortress2Game.sniper_primary_base())
+        weaponsList.extend(TeamFortress2Game.sniper_secondary_base())
+        weaponsList.extend(TeamFortress2Game.sniper_melee_base())
+        weaponsList.extend(TeamFortress2Game.spy_primary_base())
+        weaponsList.extend(TeamFortress2Game.spy_secondary_base())
+        weaponsList.extend(TeamFortress2Game.spy_melee_base())
+        weaponsList.extend(TeamFortress2Game.spy_watch_base())
+
+        return tuple(sorted(set(weaponsList)))
+
+    @functools.cached_property
+    def all_weapons_combined(self) -> Tuple[str, ...]:
+        return self.without_excluded_weapons(self.weapons_catalog())
+
+    def all_weapons(self) -> Tuple[str, ...]:
+        return self.all_weapons_combined
 
 #####################
 # Archipelago Options
@@ -814,4 +1027,18 @@ class TeamFortress2IncludeMannVsMachine(Toggle):
     """
     Indicates whether or not to include Team Fortress 2 Mann vs Machine when generating objectives.
     """
-    display_name = "Team Fortress 2 Include Mann vs Machine"
\ No newline at end of file
+    display_name = "Team Fortress 2 Include Mann vs Machine"
+
+class TeamFortress2ExcludedMaps(OptionSet):
+    """
+    Indicates which Team Fortress 2 maps should never be picked when generating objectives.
+    """
+    display_name = "Team Fortress 2 Excluded Maps"
+    valid_keys = list(TeamFortress2Game.maps_catalog())
+
+class TeamFortress2ExcludedWeapons(OptionSet):
+    """
+    Indicates which Team Fortress 2 weapons should never be picked when generating objectives.
+    """
+    display_name = "Team Fortress 2 Excluded Weapons"
+    valid_keys = list(TeamFortress2Game.weapons_catalog())
\ No newline at end of file